@@ -6,10 +6,13 @@ Reads sensor data from an Arduino over serial and plots it live.
 import serial
 import serial.tools.list_ports
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import numpy as np
 from collections import deque
-import re
+import math
 import sys
+import threading
 import logging
 
 # ─── Configuration ──────────────────────────────────────────────────────────
@@ -17,7 +20,10 @@ import logging
 ARDUINO_PORT = "COM11"   # Change to your port (e.g. "COM3" on Windows)
 BAUD_RATE = 9600
 MAX_POINTS = 100                # Rolling window size
-PLOT_INTERVAL_MS = 1000          # How often (ms) the plot refreshes
+PLOT_INTERVAL_MS = 100           # How often (ms) the serial buffer is drained
+DISP_SKIP = 5                    # Redraw only every Nth tick (~2 Hz)
+YLIM_PAD = 0.1                   # Y-margin around the data, as a fraction of its span
+SAMPLE_DTYPE = np.float32        # Sensor history precision (well beyond display needs)
 
 # ─── Logging ────────────────────────────────────────────────────────────────
 
@@ -30,95 +36,165 @@ log = logging.getLogger(__name__)
 
 # ─── Sensor parsing ─────────────────────────────────────────────────────────
 
-# Pre-compile every regex once at module load — avoids recompiling each frame.
-SENSOR_PATTERNS: dict[str, re.Pattern] = {
-    "accel_x":          re.compile(r"Acceleration X:\s*([-+]?[\d.]+)"),
-    "accel_y":          re.compile(r"Y:\s*([-+]?[\d.]+)"),
-    "accel_z":          re.compile(r"Z:\s*([-+]?[\d.]+)"),
-    "rotation_x":       re.compile(r"Rotation X:\s*([-+]?[\d.]+)"),
-    "rotation_y":       re.compile(r"Y:\s*([-+]?[\d.]+)"),
-    "rotation_z":       re.compile(r"Z:\s*([-+]?[\d.]+)"),
-    "pressure":         re.compile(r"Pressure:\s*([\d.]+)\s*Pa"),
-    "raw_altitude":     re.compile(r"Raw altitude:\s*([-+]?[\d.]+)\s*m"),
-    "filtered_altitude":re.compile(r"Filtered altitude:\s*([-+]?[\d.]+)\s*m"),
-    "mpu_temp":         re.compile(r"MPU Temperature:\s*([-+]?[\d.]+)\s*degC"),
-    "bmp_temp":         re.compile(r"BMP Temperature:\s*([-+]?[\d.]+)\s*degC"),
+# Every line the Arduino prints reads "<tag>: <value>[, Y: <value>, Z: <value>] <unit>".
+# Each tag maps to the sensor keys its values feed, in order. The X/Y/Z
+# readings share one line, so the "Y:"/"Z:" labels never need telling apart.
+SENSOR_TAGS: dict[bytes, tuple[str, ...]] = {
+    b"Acceleration X":    ("accel_x", "accel_y", "accel_z"),
+    b"Rotation X":        ("rotation_x", "rotation_y", "rotation_z"),
+    b"Pressure":          ("pressure",),
+    b"Raw altitude":      ("raw_altitude",),
+    b"Filtered altitude": ("filtered_altitude",),
+    b"MPU Temperature":   ("mpu_temp",),
+    b"BMP Temperature":   ("bmp_temp",),
 }
 
-SENSOR_KEYS = list(SENSOR_PATTERNS.keys())
+SENSOR_KEYS = [key for keys in SENSOR_TAGS.values() for key in keys]
+SENSOR_INDEX = {key: i for i, key in enumerate(SENSOR_KEYS)}
 
+# tag → (sensor keys, slice picking their value tokens). With the commas gone
+# the values are every other token: "1.00 Y: 2.00 Z: 3.00 m/s^2", "101325.00 Pa".
+_TAG_FIELDS = {tag: (keys, slice(0, 2 * len(keys), 2)) for tag, keys in SENSOR_TAGS.items()}
 
-def parse_sensor_data(line: str) -> tuple[str | None, float | None]:
-    """Return (key, value) for the first pattern that matches, or (None, None)."""
-    for key, pattern in SENSOR_PATTERNS.items():
-        match = pattern.search(line)
-        if match:
-            return key, float(match.group(1))
-    return None, None
+
+def parse_sensor_data(line: bytes) -> list[tuple[str, float]]:
+    """Return the (key, value) pairs on one line, or [] for any other line."""
+    # A dict lookup on the tag plus float() on the tokens — no regex engine.
+    tag, _, rest = line.partition(b": ")
+    fields = _TAG_FIELDS.get(tag)
+    if fields is None:
+        return []
+
+    keys, picks = fields
+    try:
+        values = list(map(float, rest.replace(b",", b" ").split()[picks]))
+    except ValueError:                          # garbled value
+        return []
+    if len(values) != len(keys) or not all(map(math.isfinite, values)):
+        return []                               # truncated line, or "nan"/"inf"
+    return list(zip(keys, values))
 
 
 # ─── Serial reader ──────────────────────────────────────────────────────────
 
 
 class SerialReader:
-    """Manages the serial connection and feeds parsed values into deques."""
+    """Manages the serial connection and feeds parsed values into a sample buffer."""
 
     def __init__(self, port: str, baud: int, max_points: int):
         self.port = port
         self.baud = baud
         self.ser: serial.Serial | None = None
 
-        # One deque per sensor key, shared with the plotter.
-        self.data: dict[str, deque] = {
-            key: deque(maxlen=max_points) for key in SENSOR_KEYS
-        }
+        # Bytes received but not yet parsed — at most one partial line.
+        # Only touched by the receive thread.
+        self._rx = b""
+
+        # Parsed (key, value) pairs handed from the receive thread to read().
+        # deque.append/popleft are atomic, so no lock is needed.
+        self._samples: deque[tuple[str, float]] = deque()
+        self._rx_thread: threading.Thread | None = None
+        self._running = False
+
+        # One row per sensor (indexed via SENSOR_INDEX) and one column per
+        # time step, shared with the plotter. Column write_idx collects the
+        # current step; a sensor that misses a step leaves a NaN gap. Columns
+        # fill left to right and shift left once full, so data[:, :count] is
+        # always oldest-first and slices without copying.
+        self.data = np.full((len(SENSOR_KEYS), max_points), np.nan, dtype=SAMPLE_DTYPE)
+        self.write_idx = 0
+        self.count = 0
+        self._seen = [False] * len(SENSOR_KEYS)   # sensors already in column write_idx
 
     # ── lifecycle ────────────────────────────────────────────────────────────
 
     def open(self) -> None:
         """Open the serial port, or print available ports and exit."""
         try:
-            self.ser = serial.Serial(self.port, self.baud, timeout=1)
+            self.ser = serial.Serial(self.port, self.baud, timeout=1, rtscts=False, exclusive=True)
+            if hasattr(self.ser, "set_buffer_size"):   # Windows only
+                # A larger driver buffer rides out longer stalls without overruns.
+                self.ser.set_buffer_size(rx_size=65536)
             log.info("Connected to %s at %d baud", self.port, self.baud)
         except serial.SerialException as exc:
             log.error("Could not open %s: %s", self.port, exc)
             self._print_available_ports()
             sys.exit(1)
 
+        # Drain the port on its own thread so GUI stalls can't back up the
+        # UART buffer and a slow port can't stall redraws.
+        self._running = True
+        self._rx_thread = threading.Thread(target=self._rx_loop, name="serial-rx", daemon=True)
+        self._rx_thread.start()
+
     def close(self) -> None:
+        self._running = False
+        if self._rx_thread:
+            self._rx_thread.join(timeout=2)   # the port's read timeout is 1 s
         if self.ser and self.ser.is_open:
             self.ser.close()
             log.info("Serial connection closed.")
 
     # ── reading ──────────────────────────────────────────────────────────────
 
-    def read(self) -> None:
-        """Drain every complete line currently in the serial buffer."""
-        if not self.ser or not self.ser.in_waiting:
-            return
-
-        try:
-            # Read all waiting bytes at once, then split into lines.
-            raw = self.ser.read(self.ser.in_waiting)
-            lines = raw.decode("utf-8", errors="replace").splitlines()
-
+    def read(self) -> set[str]:
+        """Move every sample queued by the receive thread into the buffer.
+
+        Returns the keys whose plotted data changed, so callers know what to
+        redraw — every key once the window has scrolled.
+        """
+        fresh: set[str] = set()
+        samples, data, seen = self._samples, self.data, self._seen
+        scrolled = False
+        while samples:
+            key, value = samples.popleft()
+            k = SENSOR_INDEX[key]
+            if seen[k]:   # the sensor repeats, so the current time step is over
+                scrolled |= self._advance()
+            data[k, self.write_idx] = value
+            seen[k] = True
+            fresh.add(key)
+
+        if not fresh:
+            return fresh
+        self.count = self.write_idx + 1
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Buffered samples for %d sensors", len(fresh))
+        return set(SENSOR_KEYS) if scrolled else fresh
+
+    def _rx_loop(self) -> None:
+        """Receive thread: block on the port and queue every parsed sample."""
+        while self._running:
+            try:
+                # Block for at least one byte, then take everything waiting.
+                self._rx += self.ser.read(self.ser.in_waiting or 1)
+            except serial.SerialException as exc:
+                log.warning("Serial read error: %s", exc)
+                return
+
+            # Split off the complete lines; the trailing partial line is kept
+            # for the next read instead of being parsed as broken halves.
+            *lines, self._rx = self._rx.split(b"\n")
+            debug = log.isEnabledFor(logging.DEBUG)   # checked once per chunk
             for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                key, value = parse_sensor_data(line)
-                if key and value is not None:
-                    self.data[key].append(value)
-                    log.info("Parsed: %s = %s", key, value)
-                else:
+                pairs = parse_sensor_data(line)
+                if pairs:
+                    self._samples.extend(pairs)
+                elif debug and line.strip():
                     log.debug("No match for line: %s", line[:60])
 
-        except serial.SerialException as exc:
-            log.warning("Serial read error: %s", exc)
-
     # ── helpers ──────────────────────────────────────────────────────────────
 
+    def _advance(self) -> bool:
+        """Start a new time-step column. True if the window had to scroll."""
+        self._seen[:] = [False] * len(self._seen)
+        if self.write_idx + 1 < self.data.shape[1]:
+            self.write_idx += 1
+            return False
+        self.data[:, :-1] = self.data[:, 1:]
+        self.data[:, -1] = np.nan
+        return True
+
     @staticmethod
     def _print_available_ports() -> None:
         ports = serial.tools.list_ports.comports()
@@ -131,19 +207,34 @@ class SerialReader:
 # ─── Plotting ───────────────────────────────────────────────────────────────
 
 
-def _normalize(seq: deque) -> list[float]:
-    """Min-max normalise a deque to [0, 1]. Safe when all values are equal."""
-    lo, hi = min(seq), max(seq)
-    span = hi - lo or 1.0          # avoid division by zero
-    return [(v - lo) / span for v in seq]
+def _row_extremes(buf: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-row (min, max) over the last axis, skipping NaN gaps.
+
+    Rows with no data at all come out as (inf, -inf), without warnings.
+    """
+    return (
+        np.fmin.reduce(buf, axis=-1, initial=np.inf),
+        np.fmax.reduce(buf, axis=-1, initial=-np.inf),
+    )
+
+
+def _normalize(buf: np.ndarray) -> np.ndarray:
+    """Min-max normalise each sensor row to [0, 1] at once. Safe when all values are equal."""
+    arr = np.asarray(buf, dtype=SAMPLE_DTYPE)   # no copy for the sample buffer
+    lo, hi = _row_extremes(arr)
+    lo, span = lo[..., None], (hi - lo)[..., None]
+    return (arr - lo) / np.where(span > 0, span, 1)   # avoid division by zero
 
 
 class LivePlotter:
-    """Owns the matplotlib figure and updates it every frame."""
+    """Owns the matplotlib figure and blits fresh line data every frame."""
 
     def __init__(self, reader: SerialReader):
         self.reader = reader
 
+        # Sample-number axis, built once and sliced every frame.
+        self._x = np.arange(reader.data.shape[1], dtype=SAMPLE_DTYPE)
+
         self.fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         self.ax1, self.ax2, self.ax3, self.ax4 = axes.flat
         self.fig.suptitle("CANSAT Sensor Data Monitoring", fontsize=14, fontweight="bold")
@@ -152,88 +243,185 @@ class LivePlotter:
         # Create secondary y-axis for pressure/altitude plot
         self.ax3_altitude = self.ax3.twinx()
 
-    # ── animation callback ───────────────────────────────────────────────────
-
-    def update(self, _frame: int) -> None:
-        """Called by FuncAnimation every tick. Reads serial then redraws."""
-        self.reader.read()
-        d = self.reader.data
-
-        axes = [self.ax1, self.ax2, self.ax3, self.ax4]
-        for ax in axes:
-            ax.clear()
-        self.ax3_altitude.clear()
-
-        x = list(range(max((len(d[k]) for k in SENSOR_KEYS), default=0)))
+        # Persistent artists — built once, only their data changes per frame.
+        # animated=True keeps them out of full draws, so the cached backgrounds
+        # hold just the static axes, grid, titles and legends. The X/Y/Z keys
+        # of a panel share one LineCollection, stroked in a single call.
+        self.lines: dict[str, Line2D | LineCollection] = {}
+        self._segments: dict[LineCollection, np.ndarray] = {}
 
         # ── Acceleration ─────────────────────────────────────────────────────
-        if d["accel_x"] and d["accel_y"] and d["accel_z"]:
-            n = min(len(d["accel_x"]), len(d["accel_y"]), len(d["accel_z"]))
-            xs = list(range(n))
-            self.ax1.plot(xs, list(d["accel_x"])[:n],  "r-", label="X", marker="o", alpha=0.7)
-            self.ax1.plot(xs, list(d["accel_y"])[:n],  "g-", label="Y", marker="s", alpha=0.7)
-            self.ax1.plot(xs, list(d["accel_z"])[:n],  "b-", label="Z", marker="^", alpha=0.7)
-            self._style(self.ax1, ylabel="Acceleration (m/s²)", title="Acceleration", legend=True)
+        handles = self._xyz_collection(self.ax1, ("accel_x", "accel_y", "accel_z"))
+        self._style(self.ax1, ylabel="Acceleration (m/s²)", title="Acceleration", legend=True, handles=handles)
 
         # ── Rotation (Angular Velocity) ──────────────────────────────────────
-        if d["rotation_x"] and d["rotation_y"] and d["rotation_z"]:
-            n = min(len(d["rotation_x"]), len(d["rotation_y"]), len(d["rotation_z"]))
-            xs = list(range(n))
-            self.ax2.plot(xs, list(d["rotation_x"])[:n],  "r-", label="X", marker="o", alpha=0.7)
-            self.ax2.plot(xs, list(d["rotation_y"])[:n],  "g-", label="Y", marker="s", alpha=0.7)
-            self.ax2.plot(xs, list(d["rotation_z"])[:n],  "b-", label="Z", marker="^", alpha=0.7)
-            self._style(self.ax2, ylabel="Rotation (rad/s)", title="Angular Velocity", legend=True)
+        handles = self._xyz_collection(self.ax2, ("rotation_x", "rotation_y", "rotation_z"))
+        self._style(self.ax2, ylabel="Rotation (rad/s)", title="Angular Velocity", legend=True, handles=handles)
 
         # ── Pressure & Altitude ──────────────────────────────────────────────
-        if d["pressure"] and d["raw_altitude"] and d["filtered_altitude"]:
-            n = min(len(d["pressure"]), len(d["raw_altitude"]), len(d["filtered_altitude"]))
-            xs = list(range(n))
-            self.ax3.plot(xs, list(d["pressure"])[:n], "b-", label="Pressure", marker="o", alpha=0.7)
-            self.ax3_altitude.plot(xs, list(d["raw_altitude"])[:n], "r--", label="Raw Alt", marker="s", alpha=0.7)
-            self.ax3_altitude.plot(xs, list(d["filtered_altitude"])[:n], "g--", label="Filtered Alt", marker="^", alpha=0.7)
-            self.ax3.set_ylabel("Pressure (Pa)", fontsize=10, color="b")
-            self.ax3_altitude.set_ylabel("Altitude (m)", fontsize=10, color="g")
-            self.ax3.set_title("Pressure and Altitude over Time", fontsize=12, fontweight="bold")
-            self.ax3.grid(True, alpha=0.3)
-            self.ax3.set_xlabel("Sample Number", fontsize=10)
-            lines1, labels1 = self.ax3.get_legend_handles_labels()
-            lines2, labels2 = self.ax3_altitude.get_legend_handles_labels()
-            self.ax3.legend(lines1 + lines2, labels1 + labels2, loc="best")
+        self.lines["pressure"], = self.ax3.plot([], [], "b-", label="Pressure", alpha=0.7, animated=True)
+        self.lines["raw_altitude"], = self.ax3_altitude.plot([], [], "r--", label="Raw Alt", alpha=0.7, animated=True)
+        self.lines["filtered_altitude"], = self.ax3_altitude.plot([], [], "g--", label="Filtered Alt", alpha=0.7, animated=True)
+        self.ax3.set_ylabel("Pressure (Pa)", fontsize=10, color="b")
+        self.ax3_altitude.set_ylabel("Altitude (m)", fontsize=10, color="g")
+        self.ax3.set_title("Pressure and Altitude over Time", fontsize=12, fontweight="bold")
+        self.ax3.grid(True, alpha=0.3)
+        lines1, labels1 = self.ax3.get_legend_handles_labels()
+        lines2, labels2 = self.ax3_altitude.get_legend_handles_labels()
+        self.ax3.legend(lines1 + lines2, labels1 + labels2, loc="upper right")
 
         # ── Temperatures (MPU and BMP) ───────────────────────────────────────
-        if d["mpu_temp"] and d["bmp_temp"]:
-            n = min(len(d["mpu_temp"]), len(d["bmp_temp"]))
-            xs = list(range(n))
-            self.ax4.plot(xs, list(d["mpu_temp"])[:n], "orange", label="MPU Temp", marker="D", alpha=0.7)
-            self.ax4.plot(xs, list(d["bmp_temp"])[:n], "purple", label="BMP Temp", marker="D", alpha=0.7)
-            self._style(self.ax4, ylabel="Temperature (°C)", title="Temperatures", legend=True)
-
-        # ── shared x-label ───────────────────────────────────────────────────
-        for ax in axes:
+        self.lines["mpu_temp"], = self.ax4.plot([], [], "orange", label="MPU Temp", alpha=0.7, animated=True)
+        self.lines["bmp_temp"], = self.ax4.plot([], [], "purple", label="BMP Temp", alpha=0.7, animated=True)
+        self._style(self.ax4, ylabel="Temperature (°C)", title="Temperatures", legend=True)
+
+        # ── shared x-label and fixed rolling window ──────────────────────────
+        for ax in axes.flat:
             ax.set_xlabel("Sample Number", fontsize=10)
+            ax.set_xlim(0, reader.data.shape[1])
+
+        # Sensor keys drawn on each panel. A panel is blitted as one region
+        # (its axes bbox), which also covers the altitude twin of ax3.
+        self._panels: list[tuple[plt.Axes, tuple[str, ...]]] = [
+            (self.ax1, ("accel_x", "accel_y", "accel_z")),
+            (self.ax2, ("rotation_x", "rotation_y", "rotation_z")),
+            (self.ax3, ("pressure", "raw_altitude", "filtered_altitude")),
+            (self.ax4, ("mpu_temp", "bmp_temp")),
+        ]
+
+        # Buffer rows behind each panel, and behind each of its y-axes; ax3 and its altitude
+        # twin are scaled independently.
+        self._panel_rows = [[SENSOR_INDEX[k] for k in keys] for _ax, keys in self._panels]
+        self._panel_axes: list[list[tuple[plt.Axes, list[int]]]] = []
+        for _ax, keys in self._panels:
+            by_axes: dict[plt.Axes, list[int]] = {}
+            for k in keys:
+                by_axes.setdefault(self.lines[k].axes, []).append(SENSOR_INDEX[k])
+            self._panel_axes.append(list(by_axes.items()))
+
+        # Distinct artists per panel, in draw order.
+        self._panel_artists = [
+            list(dict.fromkeys(self.lines[k] for k in keys)) for _ax, keys in self._panels
+        ]
+
+        # Backgrounds are re-captured after every full draw, which includes
+        # the redraw matplotlib does after a window resize.
+        self._bgs: list = []
+        self._tick = 0
+        self._fresh: set[str] = set()   # keys with samples not yet drawn
+        self.fig.canvas.mpl_connect("draw_event", self._recapture_bg)
+        self.fig.canvas.draw()
+
+    # ── animation callback ───────────────────────────────────────────────────
+
+    def update(self) -> None:
+        """Called by the canvas timer every tick. Reads serial, blits every DISP_SKIP-th tick."""
+        self._fresh.update(self.reader.read())
+        self._tick += 1
+        if self._tick % DISP_SKIP or not self._bgs or not self.reader.count:
+            return
+        n = self.reader.count
+        d, xs = self.reader.data[:, :n], self._x[:n]
+
+        # Every sensor's extremes in one vectorised pass over the window;
+        # sensors with no data yet come out as +inf/-inf.
+        lo, hi = _row_extremes(d)
+
+        dirty = []
+        for i, (_ax, keys) in enumerate(self._panels):
+            rows = self._panel_rows[i]
+            if self._fresh.isdisjoint(keys) or not np.isfinite(lo[rows]).all():
+                continue
+            artist = self.lines[keys[0]]
+            if isinstance(artist, LineCollection):
+                segments = self._segments[artist]
+                segments[:, :n, 1] = d[rows]
+                artist.set_segments(segments[:, :n])
+            else:
+                for k, row in zip(keys, rows):
+                    self.lines[k].set_data(xs, d[row])
+            dirty.append(i)
+        self._fresh.clear()
+
+        if not dirty:
+            return
+
+        # New limits invalidate the cached tick labels/grid — redraw everything
+        # once; _recapture_bg then refreshes the backgrounds and the lines.
+        rescaled = [
+            self._fit_ylim(ax, float(lo[rows].min()), float(hi[rows].max()))
+            for i in dirty
+            for ax, rows in self._panel_axes[i]
+        ]
+        if any(rescaled):
+            self.fig.canvas.draw_idle()
+            return
+
+        canvas = self.fig.canvas
+        for i in dirty:
+            ax, _keys = self._panels[i]
+            canvas.restore_region(self._bgs[i])
+            for artist in self._panel_artists[i]:
+                ax.draw_artist(artist)
+            canvas.blit(ax.bbox)
+
+    def _recapture_bg(self, _event) -> None:
+        """Cache each panel's static background, then paint the lines on top."""
+        canvas = self.fig.canvas
+        self._bgs = [canvas.copy_from_bbox(ax.bbox) for ax, _ in self._panels]
+        for artist in dict.fromkeys(self.lines.values()):
+            self.fig.draw_artist(artist)
 
     # ── helpers ──────────────────────────────────────────────────────────────
 
+    def _xyz_collection(self, ax, keys: tuple[str, str, str]) -> list[Line2D]:
+        """Add one red/green/blue LineCollection to ax that draws all three keys.
+
+        Returns proxy lines for the legend, since a collection has one entry.
+        """
+        colors = ("r", "g", "b")
+        collection = LineCollection([], colors=colors, linewidths=1.5, alpha=0.7, animated=True)
+        ax.add_collection(collection, autolim=False)
+        for k in keys:
+            self.lines[k] = collection
+
+        # (line, point, xy) vertex array reused every frame; x never changes.
+        segments = np.empty((len(keys), self._x.size, 2), dtype=SAMPLE_DTYPE)
+        segments[:, :, 0] = self._x
+        self._segments[collection] = segments
+        return [Line2D([], [], color=c, alpha=0.7, label=label) for c, label in zip(colors, "XYZ")]
+
     @staticmethod
-    def _plot_single(ax, x, seq, *, color, marker, ylabel, title):
-        """Plot a single deque if it has data, then style the axes."""
-        if seq:
-            ax.plot(x[: len(seq)], list(seq), color=color, linewidth=2, marker=marker)
-        LivePlotter._style(ax, ylabel=ylabel, title=title)
+    def _fit_ylim(ax, lo: float, hi: float) -> bool:
+        """Fit ax's y-limits around [lo, hi]. True if the limits changed.
+
+        The limits only move once the data leaves them or fills less than
+        half of the padded range, so small changes never force a full redraw.
+        """
+        pad = (hi - lo) * YLIM_PAD or 1.0
+        y0, y1 = ax.get_ylim()
+        if y0 <= lo and hi <= y1 and y1 - y0 <= 2 * (hi - lo + 2 * pad):
+            return False
+        ax.set_ylim(lo - pad, hi + pad)
+        return True
 
     @staticmethod
-    def _style(ax, *, ylabel: str, title: str, legend: bool = False):
+    def _style(ax, *, ylabel: str, title: str, legend: bool = False, handles=None):
         ax.set_ylabel(ylabel, fontsize=10)
         ax.set_title(f"{title} over Time", fontsize=12, fontweight="bold")
         ax.grid(True, alpha=0.3)
         if legend:
-            ax.legend(loc="best")
+            ax.legend(handles=handles, loc="upper right")
 
     # ── run ──────────────────────────────────────────────────────────────────
 
     def start(self) -> None:
-        # Keep a reference so the animation isn't garbage-collected.
-        self._ani = FuncAnimation(self.fig, self.update, interval=PLOT_INTERVAL_MS)
+        # A plain canvas timer rather than FuncAnimation: without blit=True the
+        # animation forces a full draw_idle() after every frame.
+        # Keep a reference so the timer isn't garbage-collected.
+        self._timer = self.fig.canvas.new_timer(interval=PLOT_INTERVAL_MS)
+        self._timer.add_callback(self.update)
+        self._timer.start()
         plt.show()
 
 